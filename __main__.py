@@ -2,13 +2,12 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
-#     "azure-devops>=7.0.0",
 #     "azure-identity>=1.16.0",
 #     "msgraph-core>=1.0.0",
 #     "click>=8.1.0",
 #     "orjson>=3.9.0",
 #     "rich>=13.0.0",
-#     "httpx>=0.24.0",
+#     "httpx[http2]>=0.24.0",
 # ]
 # ///
 """
@@ -21,12 +20,8 @@ Usage:
     uv run __main__.py process --project "My Project" --out process.json
 """
 
-import sys
-from pathlib import Path
-
-# Add the package to the Python path
-sys.path.insert(0, str(Path(__file__).parent))
-
+# Running this file as a script puts its directory first on sys.path, so the
+# package resolves without any path manipulation.
 from azdo_process_export.cli.main import cli
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+"""
+Process export command.
+
+Implements the `process` subcommand, loaded lazily by the CLI group so its
+dependencies are only imported when the command actually runs.
+"""
+
+import sys
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def _console() -> "Console":
+    """Create the Rich console on first use so fast paths like --help skip importing Rich."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _print(message: str, **kwargs: Any) -> None:
+    """Print user-facing output once all pending log lines are written, so the two stay in order."""
+    from azdo_process_export.infrastructure.logging import flush_logging
+
+    flush_logging()
+    _console().print(message, **kwargs)
+
+
+@click.command()
+@click.argument("project_name")
+@click.option(
+    "--out", type=click.Path(path_type=Path), default="process.json", help="Output file path (default: ./process.json)"
+)
+@click.option("--pat", envvar="AZDO_PAT", help="Personal Access Token (overrides DefaultAzureCredential)")
+@click.option("--skip-metrics", is_flag=True, help="Export configuration only, no Analytics queries")
+@click.option("--organization", envvar="AZDO_ORGANIZATION", help="Azure DevOps organization name or URL")
+def process(project_name: str, out: Path, pat: str | None, skip_metrics: bool, organization: str | None) -> None:
+    """Export every process artifact and activity metric for PROJECT_NAME into a single JSON file.
+
+    \b
+    Examples:
+        azdo-process-export process "My Project"
+        azdo-process-export process "My Project" --out export.json
+        azdo-process-export process "My Project" --pat $AZDO_PAT
+        azdo-process-export process "My Project" --skip-metrics
+
+    \b
+    Authentication Troubleshooting:
+        Authentication failures result in exit code 2. Common solutions:
+
+        • Ensure AZDO_ORGANIZATION is set or use --organization flag
+        • For DefaultAzureCredential: Run 'az login' or configure managed identity
+        • For PAT: Verify token has required scopes (Work Items: Read, Analytics: Read)
+        • Check structured logs for detailed error information
+    """
+    from azdo_process_export.infrastructure.logging import get_logger
+
+    logger = get_logger(__name__)
+    logger.info("Starting export for project", project=project_name)
+
+    if not organization:
+        logger.error("Organization not specified", error="missing_organization")
+        _print("[red]Organization not specified. Use --organization or set AZDO_ORGANIZATION environment variable.[/red]")
+        sys.exit(1)
+
+    # Import authentication logic
+    from azdo_process_export.infrastructure.auth import AuthenticationError, get_credentials
+
+    try:
+        _, credential_source = get_credentials(pat)
+
+        logger.info("Authentication headers generated", credential_source=credential_source)
+
+        # Actual export logic is not yet implemented; the headers are used once it is
+        logger.info(
+            "Export operation started",
+            project=project_name,
+            organization=organization,
+            output_file=str(out),
+            credential_source=credential_source,
+            skip_metrics=skip_metrics
+        )
+
+        if skip_metrics:
+            logger.info("Skipping Analytics metrics collection", skip_metrics=True)
+
+        _print("Export would complete successfully!", style="green")
+        sys.exit(0)
+
+    except AuthenticationError as e:
+        logger.error("Authentication failed", error=str(e), event_type="auth_failure")
+        _print(f"[red]Authentication failed: {e}[/red]")
+        sys.exit(2)
+
@@ -4,18 +4,46 @@ Azure DevOps Process Export CLI
 Main command-line interface using Click for the azdo-process-export tool.
 """
 
-import sys
+import importlib
 from pathlib import Path
+from typing import Any
 
 import click
-from rich.console import Console
 
-from azdo_process_export.infrastructure.logging import get_logger, setup_logging
 
-console = Console()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are needed."""
 
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any):
+        """
+        Initialize the lazy group.
 
-@click.group()
+        Args:
+            lazy_subcommands: Mapping of command name to "module.path.attribute" of the command object
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy subcommand {cmd_name!r} did not resolve to a click.Command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={"process": "azdo_process_export.cli.commands.process.process"},
+)
 @click.option(
     "--log-level",
     type=click.Choice(["info", "debug", "trace"], case_sensitive=False),
@@ -49,76 +77,16 @@ def cli(log_level: str, log_file: Path | None) -> None:
     Required Configuration:
         AZDO_ORGANIZATION environment variable or --organization flag
     """
+    # structlog imports Rich when available, so defer it past --help/--version
+    from azdo_process_export.infrastructure.logging import flush_logging, setup_logging
+
     setup_logging(
         log_level=log_level,
         log_file=log_file,
         enable_trace=(log_level.lower() == "trace")
     )
-
-
-@cli.command()
-@click.argument("project_name")
-@click.option(
-    "--out", type=click.Path(path_type=Path), default="process.json", help="Output file path (default: ./process.json)"
-)
-@click.option("--pat", envvar="AZDO_PAT", help="Personal Access Token (overrides DefaultAzureCredential)")
-@click.option("--skip-metrics", is_flag=True, help="Export configuration only, no Analytics queries")
-@click.option("--organization", envvar="AZDO_ORGANIZATION", help="Azure DevOps organization name or URL")
-def process(project_name: str, out: Path, pat: str | None, skip_metrics: bool, organization: str | None) -> None:
-    """Export every process artifact and activity metric for PROJECT_NAME into a single JSON file.
-
-    \b
-    Examples:
-        azdo-process-export process "My Project"
-        azdo-process-export process "My Project" --out export.json
-        azdo-process-export process "My Project" --pat $AZDO_PAT
-        azdo-process-export process "My Project" --skip-metrics
-
-    \b
-    Authentication Troubleshooting:
-        Authentication failures result in exit code 2. Common solutions:
-
-        • Ensure AZDO_ORGANIZATION is set or use --organization flag
-        • For DefaultAzureCredential: Run 'az login' or configure managed identity
-        • For PAT: Verify token has required scopes (Work Items: Read, Analytics: Read)
-        • Check structured logs for detailed error information
-    """
-    logger = get_logger(__name__)
-    logger.info("Starting export for project", project=project_name)
-
-    if not organization:
-        logger.error("Organization not specified", error="missing_organization")
-        console.print("[red]Organization not specified. Use --organization or set AZDO_ORGANIZATION environment variable.[/red]")
-        sys.exit(1)
-
-    # Import authentication logic
-    from azdo_process_export.infrastructure.auth import AuthenticationError, get_credentials
-
-    try:
-        auth_headers, credential_source = get_credentials(pat)
-
-        logger.info("Authentication headers generated", credential_source=credential_source)
-
-        # Simulate using the headers for an API call (actual export logic not yet implemented)
-        logger.info(
-            "Export operation started",
-            project=project_name,
-            organization=organization,
-            output_file=str(out),
-            credential_source=credential_source,
-            skip_metrics=skip_metrics
-        )
-
-        if skip_metrics:
-            logger.info("Skipping Analytics metrics collection", skip_metrics=True)
-
-        console.print("Export would complete successfully!", style="green")
-        sys.exit(0)
-
-    except AuthenticationError as e:
-        logger.error("Authentication failed", error=str(e), event_type="auth_failure")
-        console.print(f"[red]Authentication failed: {e}[/red]")
-        sys.exit(2)
+    # Logs are written by a background thread; make sure they are out before the command returns
+    click.get_current_context().call_on_close(flush_logging)
 
 
 if __name__ == "__main__":
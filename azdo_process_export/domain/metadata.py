@@ -5,16 +5,28 @@ This module provides functionality to fetch project metadata from Azure DevOps
 using the REST APIs.
 """
 
-from typing import Optional
+import asyncio
+from typing import Any, Optional
 
-from azure.devops.connection import Connection
-from azure.devops.v7_1.core.core_client import CoreClient
-from azure.devops.v7_1.core.models import TeamProject
-from msrest.authentication import BasicAuthentication
-from azure.core.exceptions import ResourceNotFoundError
-from msrest.exceptions import HttpOperationError
+import httpx
+import orjson
 
 from azdo_process_export.domain.models import Project, Collection, Team
+from azdo_process_export.infrastructure.auth import basic_auth_header
+from azdo_process_export.infrastructure.cache import ETagCache
+
+# Projects API paging: pages of PROJECTS_PAGE_SIZE are fetched PROJECTS_PAGE_WINDOW at a time
+PROJECTS_API_VERSION = "7.1"
+PROJECTS_PAGE_SIZE = 100
+PROJECTS_PAGE_WINDOW = 4
+
+# (Project field, REST API key, default) for the scalar project attributes
+_PROJECT_FIELDS = (
+    ("description", "description", ""),
+    ("state", "state", "wellFormed"),
+    ("revision", "revision", 0),
+    ("visibility", "visibility", "private"),
+)
 
 
 class ProjectNotFoundError(Exception):
@@ -35,26 +47,56 @@ class ServiceUnavailableError(Exception):
 class ProjectMetadataService:
     """Service for fetching project metadata from Azure DevOps."""
     
-    def __init__(self, organization_url: str, personal_access_token: str):
+    def __init__(
+        self,
+        organization_url: str,
+        personal_access_token: str,
+        etag_cache: ETagCache | None = None,
+    ):
         """
         Initialize the ProjectMetadataService.
         
         Args:
             organization_url: The base URL of the Azure DevOps organization
             personal_access_token: Personal Access Token for authentication
+            etag_cache: Response cache for conditional project requests (default: per-user cache)
         """
         self.organization_url = organization_url
-        self.personal_access_token = personal_access_token
         
-        # Initialize Azure DevOps connection
-        credentials = BasicAuthentication('', personal_access_token)
-        self._connection = Connection(base_url=organization_url, creds=credentials)
-        self._core_client = self._connection.clients.get_core_client()
+        # Encode the Authorization header once; only the header is retained, not the PAT itself
+        self._headers = httpx.Headers({
+            "Authorization": basic_auth_header(personal_access_token),
+            "Accept": "application/json",
+            "User-Agent": "azdo-process-export/0.1.0",
+        })
+
+        # Shared client so every REST call reuses pooled keep-alive connections
+        self._http = httpx.Client(
+            base_url=organization_url,
+            headers=self._headers,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+
+        self._etag_cache = etag_cache if etag_cache is not None else ETagCache()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> "ProjectMetadataService":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
     
     def get_project_by_id(self, project_id: str) -> Project:
         """
         Fetch project metadata by project ID.
         
+        A cached response for the project is revalidated by ETag, so an
+        unchanged project costs a 304 instead of a full body.
+        
         Args:
             project_id: The ID of the project to fetch
             
@@ -66,31 +108,30 @@ class ProjectMetadataService:
             AuthenticationError: If authentication fails
             ServiceUnavailableError: If the service is unavailable
         """
-        try:
-            # Fetch project data from Azure DevOps
-            team_project = self._core_client.get_project(
-                project_id=project_id,
-                include_capabilities=True
-            )
-            
-            # Convert Azure DevOps TeamProject to our domain model
-            return self._convert_team_project_to_domain_model(team_project)
-            
-        except HttpOperationError as e:
-            if e.response.status_code == 404:
-                raise ProjectNotFoundError(f"Project with ID '{project_id}' not found")
-            elif e.response.status_code == 401:
-                raise AuthenticationError("Authentication failed. Please check your credentials.")
-            elif e.response.status_code >= 500:
-                raise ServiceUnavailableError("Azure DevOps service is currently unavailable")
-            else:
-                raise ServiceUnavailableError(f"Azure DevOps API error: {e}")
-        except Exception as e:
-            # Check for Azure DevOps specific "project does not exist" error
-            error_msg = str(e)
-            if "TF200016" in error_msg or "does not exist" in error_msg:
-                raise ProjectNotFoundError(f"Project with ID '{project_id}' not found")
-            raise ServiceUnavailableError(f"Unexpected error: {e}")
+        cache_key = f"{self.organization_url}/_apis/projects/{project_id}"
+        cached_response = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached_response.etag} if cached_response else None
+
+        # Fetch project data from Azure DevOps, revalidating any cached copy
+        response = self._get(
+            f"/_apis/projects/{project_id}",
+            params={"api-version": PROJECTS_API_VERSION, "includeCapabilities": "true"},
+            headers=headers,
+        )
+        if response.status_code == 304 and cached_response:
+            body = cached_response.body
+        elif response.status_code == 404:
+            # Azure DevOps reports TF200016 "project does not exist" as a 404
+            raise ProjectNotFoundError(f"Project with ID '{project_id}' not found")
+        else:
+            _raise_for_status(response)
+            body = response.content
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache.put(cache_key, etag, body)
+        
+        # Convert Azure DevOps project JSON to our domain model
+        return self._convert_team_project_to_domain_model(orjson.loads(body))
     
     def list_projects(self, continuation_token: Optional[str] = None) -> list[Project]:
         """
@@ -106,71 +147,178 @@ class ProjectMetadataService:
             AuthenticationError: If authentication fails
             ServiceUnavailableError: If the service is unavailable
         """
+        # Fetch projects data from Azure DevOps
+        params = {"api-version": PROJECTS_API_VERSION}
+        if continuation_token:
+            params["continuationToken"] = continuation_token
+        response = self._get("/_apis/projects", params=params)
+        _raise_for_status(response)
+        project_list = orjson.loads(response.content).get("value", [])
+        
+        # Convert Azure DevOps project JSON objects to our domain models
+        projects = []
+        for team_project in project_list:
+            project = self._convert_team_project_to_domain_model(team_project)
+            projects.append(project)
+        
+        return projects
+
+    def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Issue a GET on the shared client, mapping transport failures to ServiceUnavailableError."""
         try:
-            # Fetch projects data from Azure DevOps
-            get_projects_response = self._core_client.get_projects(
-                continuation_token=continuation_token
-            )
-            
-            # Handle different response formats
-            if hasattr(get_projects_response, 'value'):
-                # Response has a .value attribute (wrapped response)
-                project_list = get_projects_response.value
-            else:
-                # Response is the list directly
-                project_list = get_projects_response
-            
-            # Convert Azure DevOps TeamProject objects to our domain models
-            projects = []
-            for team_project in project_list:
-                project = self._convert_team_project_to_domain_model(team_project)
-                projects.append(project)
-            
-            return projects
-            
-        except HttpOperationError as e:
-            if e.response.status_code == 401:
-                raise AuthenticationError("Authentication failed. Please check your credentials.")
-            elif e.response.status_code >= 500:
-                raise ServiceUnavailableError("Azure DevOps service is currently unavailable")
-            else:
-                raise ServiceUnavailableError(f"Azure DevOps API error: {e}")
-        except Exception as e:
-            raise ServiceUnavailableError(f"Unexpected error: {e}")
+            return self._http.get(url, **kwargs)
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"Unexpected error: {e}") from e
     
-    def _convert_team_project_to_domain_model(self, team_project: TeamProject) -> Project:
+    def _convert_team_project_to_domain_model(self, team_project: dict[str, Any]) -> Project:
         """
-        Convert Azure DevOps TeamProject to our domain Project model.
+        Convert Azure DevOps project JSON to our domain Project model.
         
         Args:
-            team_project: Azure DevOps TeamProject object
+            team_project: Project object as returned by the projects REST API
             
         Returns:
             Project domain model object
         """
+        get = team_project.get
+        project_id = team_project["id"]
+        project_name = team_project["name"]
+        project_url = get("url")
+        organization_url = self.organization_url
+
         # Create Collection object from the project data
         collection = Collection(
-            id=getattr(team_project, 'collection_id', team_project.id),
-            name=getattr(team_project, 'collection_name', 'DefaultCollection'),
-            url=self.organization_url,
-            collection_url=self.organization_url
+            id=get("collectionId", project_id),
+            name=get("collectionName", "DefaultCollection"),
+            url=organization_url,
+            collection_url=organization_url
         )
         
         # Create default Team object (Azure DevOps projects have a default team)
+        team_ref = get("defaultTeam") or {}
         default_team = Team(
-            id=getattr(team_project, 'default_team_id', f"{team_project.id} Team"),
-            name=getattr(team_project, 'default_team_name', f"{team_project.name} Team"),
-            url=f"{team_project.url}/_apis/projects/{team_project.id}/teams/{team_project.id}%20Team"
+            id=team_ref.get("id", f"{project_id} Team"),
+            name=team_ref.get("name", f"{project_name} Team"),
+            url=team_ref.get("url", f"{project_url}/_apis/projects/{project_id}/teams/{project_id}%20Team")
         )
         
         return Project(
-            id=team_project.id,
-            name=team_project.name,
-            description=getattr(team_project, 'description', ''),
-            url=team_project.url,
-            state=getattr(team_project, 'state', 'wellFormed'),
-            revision=getattr(team_project, 'revision', 0),
-            visibility=getattr(team_project, 'visibility', 'private'),
+            id=project_id,
+            name=project_name,
+            url=project_url,
             collection=collection,
-            default_team=default_team
+            default_team=default_team,
+            **{field_name: get(key, default) for field_name, key, default in _PROJECT_FIELDS},
         )
+
+    def list_all_projects(self) -> list[Project]:
+        """
+        List every project in the organization, fetching pages concurrently.
+
+        Pages are requested PROJECTS_PAGE_WINDOW at a time using $top/$skip so
+        that the round trips overlap instead of running one after another.
+
+        Returns:
+            List of Project objects in API order
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ServiceUnavailableError: If the service is unavailable
+        """
+        project_dicts = asyncio.run(self._list_all_projects_async())
+        projects = [self._convert_team_project_to_domain_model(project_dict) for project_dict in project_dicts]
+        return projects
+
+    def list_project_ids_and_names(self) -> tuple[list[str], list[str]]:
+        """
+        List the ID and name of every project as two parallel lists.
+
+        Lighter than list_all_projects for callers that only need to identify
+        projects: the raw records are read column-wise and no Project, Collection
+        or Team objects are built.
+
+        Returns:
+            Tuple of (project IDs, project names) in API order
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ServiceUnavailableError: If the service is unavailable
+        """
+        project_dicts = asyncio.run(self._list_all_projects_async())
+        ids = [project_dict["id"] for project_dict in project_dicts]
+        names = [project_dict["name"] for project_dict in project_dicts]
+        return ids, names
+
+    async def _list_all_projects_async(self) -> list[dict[str, Any]]:
+        """Fetch all raw project records using windows of concurrent page requests."""
+        limits = httpx.Limits(max_connections=PROJECTS_PAGE_WINDOW, max_keepalive_connections=PROJECTS_PAGE_WINDOW)
+        projects: list[dict[str, Any]] = []
+        async with httpx.AsyncClient(
+            base_url=self.organization_url, headers=self._headers, timeout=30.0, limits=limits
+        ) as client:
+            skip = 0
+            while True:
+                pages = await asyncio.gather(*(
+                    self._fetch_projects_page(client, skip + offset * PROJECTS_PAGE_SIZE)
+                    for offset in range(PROJECTS_PAGE_WINDOW)
+                ))
+                for page in pages:
+                    projects.extend(page)
+                # A short page means the end of the list was reached within this window
+                if any(len(page) < PROJECTS_PAGE_SIZE for page in pages):
+                    return projects
+                skip += PROJECTS_PAGE_WINDOW * PROJECTS_PAGE_SIZE
+
+    async def _fetch_projects_page(self, client: httpx.AsyncClient, skip: int) -> list[dict[str, Any]]:
+        """Fetch a single page of raw project records."""
+        params: dict[str, str | int] = {
+            "api-version": PROJECTS_API_VERSION,
+            "$top": PROJECTS_PAGE_SIZE,
+            "$skip": skip,
+        }
+        try:
+            response = await client.get("/_apis/projects", params=params)
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"Unexpected error: {e}") from e
+
+        _raise_for_status(response)
+        page = orjson.loads(response.content).get("value", [])
+        if not isinstance(page, list):
+            raise ServiceUnavailableError("Azure DevOps API error: unexpected project list response")
+        return page
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """
+    Map a non-success Azure DevOps response to the service's error types.
+
+    Only a JSON response with a 2xx status other than 203 counts as success, so
+    the body can be decoded and cached safely.
+
+    Args:
+        response: Response to check
+
+    Raises:
+        AuthenticationError: If the credentials were rejected
+        ServiceUnavailableError: For server errors and any other unexpected status
+    """
+    status_code = response.status_code
+    if status_code < 300:
+        # Azure DevOps answers an invalid PAT with 203 and an HTML sign-in page
+        if status_code == 203 or not _is_json(response):
+            raise AuthenticationError("Authentication failed. Please check your credentials.")
+        return
+    # Azure DevOps redirects to the sign-in page for invalid credentials
+    if status_code in (302, 401):
+        raise AuthenticationError("Authentication failed. Please check your credentials.")
+    elif status_code >= 500:
+        raise ServiceUnavailableError("Azure DevOps service is currently unavailable")
+    else:
+        raise ServiceUnavailableError(f"Azure DevOps API error: status {status_code}")
+
+
+def _is_json(response: httpx.Response) -> bool:
+    """Return True if the response declares a JSON body (application/json, possibly with parameters)."""
+    content_type: str = response.headers.get("Content-Type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
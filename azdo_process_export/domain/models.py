@@ -5,13 +5,22 @@ Core data structures representing the business domain of Azure DevOps projects,
 independent of infrastructure concerns.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from dataclasses import Field, dataclass, field, fields
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
+from functools import cache
+from operator import attrgetter
 from typing import Any
 
+import orjson
 
-class BugBehavior(str, Enum):
+# Field metadata keys controlling JSON export: an explicit key name, or exclusion
+JSON_KEY = "json_key"
+EXPORTED = "exported"
+
+
+class BugBehavior(StrEnum):
     """Team bug behavior settings."""
 
     AS_REQUIREMENTS = "asRequirements"
@@ -19,7 +28,7 @@ class BugBehavior(str, Enum):
     OFF = "off"
 
 
-class WorkItemState(str, Enum):
+class WorkItemState(StrEnum):
     """Common work item states."""
 
     NEW = "New"
@@ -29,7 +38,7 @@ class WorkItemState(str, Enum):
     REMOVED = "Removed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Collection:
     """Azure DevOps project collection information."""
 
@@ -39,7 +48,7 @@ class Collection:
     collection_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Azure DevOps project information."""
 
@@ -50,11 +59,12 @@ class Project:
     state: str | None = None
     revision: int | None = None
     visibility: str | None = None
-    collection: Collection | None = None
-    default_team: "Team | None" = None
+    # Collection and default team are resolved separately and not part of the exported project summary
+    collection: Collection | None = field(default=None, metadata={EXPORTED: False})
+    default_team: "Team | None" = field(default=None, metadata={EXPORTED: False})
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkItemType:
     """Work item type definition."""
 
@@ -64,10 +74,10 @@ class WorkItemType:
     color: str | None = None
     icon: str | None = None
     is_disabled: bool = False
-    usage_last_12m: int = 0
+    usage_last_12m: int = field(default=0, metadata={JSON_KEY: "usageLast12M"})
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkItemField:
     """Work item field definition."""
 
@@ -82,7 +92,7 @@ class WorkItemField:
     supported_operations: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessBehavior:
     """Process behavior configuration."""
 
@@ -93,7 +103,7 @@ class ProcessBehavior:
     abstract: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     """Team member information."""
 
@@ -109,7 +119,7 @@ class TeamMember:
     role_hint: str | None = None  # "PR-heavy", "work-item-heavy", etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamSettings:
     """Team configuration settings."""
 
@@ -120,7 +130,7 @@ class TeamSettings:
     backlog_iteration: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Azure DevOps team."""
 
@@ -133,7 +143,7 @@ class Team:
     members: list[TeamMember] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacklogLevel:
     """Backlog level configuration."""
 
@@ -145,7 +155,7 @@ class BacklogLevel:
     work_item_types: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """Activity metrics aggregated by month."""
 
@@ -157,7 +167,7 @@ class Metrics:
     pipeline_runs_per_month: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessExport:
     """Complete process export data model."""
 
@@ -169,110 +179,146 @@ class ProcessExport:
     teams: list[Team] = field(default_factory=list)
     backlog_levels: list[BacklogLevel] = field(default_factory=list)
     metrics: Metrics | None = None
-    warnings: list[str] = field(default_factory=list)
+    # Distinct warnings in the order they were first added; stored as a tuple, so use add_warning()
+    warnings: Sequence[str] = ()
+    # Insertion-ordered set of the warnings, so repeated warnings (e.g. one per team) are skipped cheaply
+    _warning_index: dict[str, None] = field(
+        default_factory=dict, init=False, repr=False, compare=False, metadata={EXPORTED: False}
+    )
+
+    def __post_init__(self) -> None:
+        self._warning_index = dict.fromkeys(self.warnings)
+        self.warnings = tuple(self._warning_index)
+
+    def add_warning(self, message: str) -> None:
+        """
+        Record a warning for the export, ignoring duplicates.
+
+        Args:
+            message: Warning message
+        """
+        if message not in self._warning_index:
+            self._warning_index[message] = None
+            self.warnings = (*self.warnings, message)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        return _dataclass_to_dict(self)
+
+    def to_json_bytes(self, option: int = 0) -> bytes:
+        """
+        Serialize directly to JSON bytes without building the nested dictionary first.
+
+        orjson walks the object graph itself and only calls back into Python for
+        each dataclass, which is mapped to its camelCase keys shallowly.
+
+        Args:
+            option: Extra orjson option flags, e.g. orjson.OPT_INDENT_2
+
+        Returns:
+            UTF-8 encoded JSON document equivalent to to_dict()
+        """
+        return orjson.dumps(self, default=orjson_default, option=option | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def to_columnar(self) -> dict[str, dict[str, list[Any]]]:
+        """
+        Materialize the flat record lists as columns (a dict of lists per list).
+
+        Bulk transforms such as metrics aggregation or CSV export can then walk
+        one list per attribute instead of loading attributes record by record.
+        Team members of all teams are flattened into a single teamMembers table.
+
+        Returns:
+            Mapping of camelCase list name to {camelCase column name: values}
+        """
         return {
-            "exportedAt": self.exported_at.isoformat(),
-            "project": {
-                "id": self.project.id,
-                "name": self.project.name,
-                "description": self.project.description,
-                "url": self.project.url,
-                "state": self.project.state,
-                "revision": self.project.revision,
-                "visibility": self.project.visibility,
-            },
-            "workItemTypes": [
-                {
-                    "name": wit.name,
-                    "refName": wit.ref_name,
-                    "description": wit.description,
-                    "color": wit.color,
-                    "icon": wit.icon,
-                    "isDisabled": wit.is_disabled,
-                    "usageLast12M": wit.usage_last_12m,
-                }
-                for wit in self.work_item_types
-            ],
-            "fields": [
-                {
-                    "refName": field.ref_name,
-                    "name": field.name,
-                    "type": field.type,
-                    "description": field.description,
-                    "usage": field.usage,
-                    "readOnly": field.read_only,
-                    "canSortBy": field.can_sort_by,
-                    "isQueryable": field.is_queryable,
-                    "supportedOperations": field.supported_operations,
-                }
-                for field in self.fields
-            ],
-            "behaviors": [
-                {
-                    "name": behavior.name,
-                    "refName": behavior.ref_name,
-                    "inherits": behavior.inherits,
-                    "description": behavior.description,
-                    "abstract": behavior.abstract,
-                }
-                for behavior in self.behaviors
-            ],
-            "teams": [
-                {
-                    "id": team.id,
-                    "name": team.name,
-                    "description": team.description,
-                    "url": team.url,
-                    "projectId": team.project_id,
-                    "settings": {
-                        "workingDays": team.settings.working_days if team.settings else [],
-                        "bugsBehavior": team.settings.bugs_behavior.value if team.settings else None,
-                        "defaultIteration": team.settings.default_iteration if team.settings else None,
-                        "defaultIterationMacro": team.settings.default_iteration_macro if team.settings else None,
-                        "backlogIteration": team.settings.backlog_iteration if team.settings else None,
-                    }
-                    if team.settings
-                    else None,
-                    "members": [
-                        {
-                            "id": member.id,
-                            "displayName": member.display_name,
-                            "uniqueName": member.unique_name,
-                            "url": member.url,
-                            "imageUrl": member.image_url,
-                            "aadId": member.aad_id,
-                            "jobTitle": member.job_title,
-                            "mail": member.mail,
-                            "roleHint": member.role_hint,
-                        }
-                        for member in team.members
-                    ],
-                }
-                for team in self.teams
-            ],
-            "backlogLevels": [
-                {
-                    "id": level.id,
-                    "name": level.name,
-                    "refName": level.ref_name,
-                    "rank": level.rank,
-                    "color": level.color,
-                    "workItemTypes": level.work_item_types,
-                }
-                for level in self.backlog_levels
-            ],
-            "metrics": {
-                "workItemsCreatedPerMonth": self.metrics.work_items_created_per_month,
-                "workItemsClosedPerMonth": self.metrics.work_items_closed_per_month,
-                "workItemsUpdatedPerMonth": self.metrics.work_items_updated_per_month,
-                "prsCreatedPerMonth": self.metrics.prs_created_per_month,
-                "prsMergedPerMonth": self.metrics.prs_merged_per_month,
-                "pipelineRunsPerMonth": self.metrics.pipeline_runs_per_month,
-            }
-            if self.metrics
-            else None,
-            "warnings": self.warnings,
+            "workItemTypes": _columns(WorkItemType, self.work_item_types),
+            "fields": _columns(WorkItemField, self.fields),
+            "behaviors": _columns(ProcessBehavior, self.behaviors),
+            "teamMembers": _columns(TeamMember, [member for team in self.teams for member in team.members]),
+            "backlogLevels": _columns(BacklogLevel, self.backlog_levels),
         }
+
+
+def _camel_case(name: str) -> str:
+    """Convert a snake_case attribute name to a camelCase JSON key."""
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def _json_key(model_field: Field) -> str:
+    """Return the JSON key for a dataclass field, honouring an explicit JSON_KEY override."""
+    return model_field.metadata.get(JSON_KEY) or _camel_case(model_field.name)
+
+
+@cache
+def _camel_fields(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+    """
+    Resolve a dataclass's exported JSON keys and a fused attribute getter, once per class.
+
+    Returns:
+        Tuple of (json_keys, getter) where getter(obj) returns the matching attribute values
+    """
+    exported = [model_field for model_field in fields(cls) if model_field.metadata.get(EXPORTED, True)]
+    names = tuple(model_field.name for model_field in exported)
+    keys = tuple(_json_key(model_field) for model_field in exported)
+    if len(names) == 1:
+        (name,) = names
+        return keys, lambda obj: (getattr(obj, name),)
+    return keys, attrgetter(*names)
+
+
+def _columns(cls: type, records: list[Any]) -> dict[str, list[Any]]:
+    """Transpose a list of dataclass records into {json key: column values}."""
+    keys, getter = _camel_fields(cls)
+    if not records:
+        return {key: [] for key in keys}
+    return dict(zip(keys, map(list, zip(*map(getter, records), strict=True)), strict=True))
+
+
+# Values of these exact types are already JSON-ready and are passed through untouched
+_PASSTHROUGH_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None), dict})
+
+
+def _dataclass_to_dict(obj: Any, passthrough: frozenset[type] = _PASSTHROUGH_TYPES) -> dict[str, Any]:
+    """Convert a domain dataclass to a camelCase dictionary, skipping fields marked as not exported."""
+    obj_type: type = type(obj)
+    keys, getter = _camel_fields(obj_type)
+    return {
+        key: value if type(value) in passthrough else _to_json_value(value)
+        for key, value in zip(keys, getter(obj), strict=True)
+    }
+
+
+def _to_json_value(value: Any, passthrough: frozenset[type] = _PASSTHROUGH_TYPES) -> Any:
+    """Convert a non-scalar field value to its JSON-ready form."""
+    value_type = type(value)
+    if value_type is list or value_type is tuple:
+        return [item if type(item) in passthrough else _to_json_value(item) for item in value]
+    if hasattr(value_type, "__dataclass_fields__"):
+        return _dataclass_to_dict(value)
+    if isinstance(value, str):
+        # StrEnum members already are their string value
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    orjson fallback that renames a passed-through dataclass's fields to camelCase keys.
+
+    Use together with orjson.OPT_PASSTHROUGH_DATACLASS so that domain models encode
+    exactly as ProcessExport.to_json_bytes() encodes them.
+
+    Raises:
+        TypeError: If the object is not a dataclass
+    """
+    obj_type: type = type(obj)
+    if hasattr(obj_type, "__dataclass_fields__"):
+        keys, getter = _camel_fields(obj_type)
+        return dict(zip(keys, getter(obj), strict=True))
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
@@ -1,25 +1,69 @@
+import asyncio
+import atexit
 import base64
+import hashlib
 import json
 import os
+import threading
+import time
+from collections.abc import Callable
+from functools import cache, lru_cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
 import httpx
+import orjson
 
+from azdo_process_export.infrastructure.cache import cache_dir, write_private_file
 from azdo_process_export.infrastructure.logging import get_logger
 
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+
 logger = get_logger(__name__)
 
 # Azure DevOps API scope constant
 AZURE_DEVOPS_SCOPE = "499b84ac-1321-427f-aa17-267ca6975798/.default"
 
+# Cached tokens (in memory and on disk) are reused only while they have more than this many seconds left
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Successful token validations are remembered for this long within the process
+VALIDATION_TTL_SECONDS = 300
+
+# (organization, token digest) -> monotonic time the token was last validated
+_validated_tokens: dict[tuple[str, str], float] = {}
+
+_validation_client: httpx.Client | None = None
+
+# Credentials handed out by get_credentials: key -> (headers, credential_source, expires_at)
+_credential_cache: dict[str, tuple[dict, str, float]] = {}
+_credential_cache_lock = threading.Lock()
+
+# azure.identity credential classes that AZDO_CREDENTIAL_CLASS may select
+AAD_CREDENTIAL_CLASSES = frozenset({
+    "DefaultAzureCredential",
+    "ManagedIdentityCredential",
+    "AzureCliCredential",
+    "EnvironmentCredential",
+    "WorkloadIdentityCredential",
+})
+
 
 class AuthenticationError(Exception):
     pass
 
 
+@cache
+def _test_json_enabled() -> bool:
+    """Return True when running under Behave (BEHAVE_JSON_LOGGING=1), read once per process."""
+    return os.environ.get("BEHAVE_JSON_LOGGING") == "1"
+
+
 def _emit_test_json_log(event_data: dict) -> None:
-    """Emit JSON log for Behave tests if environment variable is set."""
-    if os.environ.get("BEHAVE_JSON_LOGGING") == "1":
-        print(json.dumps(event_data))
+    """Emit JSON log for Behave tests."""
+    if _test_json_enabled():
+        print(orjson.dumps(event_data).decode())
 
 
 def _log_auth_success(credential_source: str, headers: dict) -> None:
@@ -44,78 +88,211 @@ def _log_auth_failure(credential_source: str, error: Exception, message: str) ->
     )
 
     # Test-specific JSON logging for Behave tests
-    if os.environ.get("BEHAVE_JSON_LOGGING") == "1":
+    if _test_json_enabled():
         print(f"auth_failure {credential_source}: {message}")
 
 
-def _validate_pat_token(pat: str, headers: dict) -> None:
-    """Validate PAT token by making a test API call."""
-    organization = os.environ.get("AZDO_ORGANIZATION")
+def _validation_key(organization: str, token: str) -> tuple[str, str]:
+    """Key validation results by organization and a digest of the token, never the raw token."""
+    return organization, hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _is_recently_validated(organization: str, token: str) -> bool:
+    """Return True if the token was validated against the organization within the TTL."""
+    validated_at = _validated_tokens.get(_validation_key(organization, token))
+    return validated_at is not None and time.monotonic() - validated_at < VALIDATION_TTL_SECONDS
+
+
+def _remember_validated(organization: str, token: str) -> None:
+    """Record a successful validation so repeat calls skip the network round trip."""
+    _validated_tokens[_validation_key(organization, token)] = time.monotonic()
+
+
+def _get_validation_client() -> httpx.Client:
+    """Return the shared keep-alive client used for token validation, creating it on first use."""
+    global _validation_client
+    if _validation_client is None:
+        _validation_client = httpx.Client(
+            http2=True,
+            timeout=10.0,
+            follow_redirects=False,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+        atexit.register(_validation_client.close)
+    return _validation_client
+
+
+@cache
+def _organization() -> str | None:
+    """Return the organization from AZDO_ORGANIZATION, read once per process."""
+    return os.environ.get("AZDO_ORGANIZATION")
+
+
+@lru_cache(maxsize=8)
+def _connection_data_url(organization: str) -> str:
+    """Return the connectionData URL used to validate tokens for an organization."""
+    return f"https://dev.azure.com/{organization}/_apis/connectionData"
+
+
+def _probe_connection_data(url: str, headers: dict) -> httpx.Response:
+    """Probe the connectionData endpoint with HEAD so no response body is transferred."""
+    client = _get_validation_client()
+    response = client.head(url, headers=headers)
+    if response.status_code == 405:
+        # Fall back to GET should the endpoint ever refuse HEAD
+        response = client.get(url, headers=headers)
+    return response
+
+
+# kind -> (invalid token message, failed status message, network warning)
+_VALIDATION_MESSAGES: dict[str, tuple[str, str, str]] = {
+    "PAT": (
+        "Invalid PAT token - authentication failed",
+        "PAT validation failed with status {status}",
+        "Could not validate PAT token due to network error",
+    ),
+    "Bearer": (
+        "Invalid Azure AD token - authentication failed",
+        "Bearer token validation failed with status {status}",
+        "Could not validate Bearer token due to network error",
+    ),
+}
+
+
+def _validate_token(kind: Literal["PAT", "Bearer"], token: str, headers: dict) -> None:
+    """Validate a PAT or Bearer token by making a test API call."""
+    organization = _organization()
     if not organization:
         # Skip validation if no organization is available
         return
 
+    invalid_message, status_message, network_message = _VALIDATION_MESSAGES[kind]
+
     # Skip validation for test organizations or if test mode is enabled
-    if organization == "test-org" or os.environ.get("BEHAVE_JSON_LOGGING") == "1":
-        # In test mode, validate based on token patterns
-        if pat == "invalid-token":
-            raise AuthenticationError("Invalid PAT token - authentication failed")
+    if organization == "test-org" or _test_json_enabled():
+        # In test mode, validate PATs based on token patterns; Azure AD tokens were
+        # already obtained from the credential chain
+        if kind == "PAT" and token == "invalid-token":
+            raise AuthenticationError(invalid_message)
         # Otherwise let valid-looking tokens pass
         return
 
-    # Use a minimal API endpoint to test authentication
-    test_url = f"https://dev.azure.com/{organization}/_apis/connectionData"
+    if _is_recently_validated(organization, token):
+        return
 
     try:
-        with httpx.Client(timeout=10.0, follow_redirects=False) as client:
-            response = client.get(test_url, headers=headers)
-            # Azure DevOps returns 302 redirect for invalid authentication
-            if response.status_code in (302, 401, 403):
-                raise AuthenticationError("Invalid PAT token - authentication failed")
-            elif response.status_code >= 400:
-                raise AuthenticationError(f"PAT validation failed with status {response.status_code}")
+        # Use a minimal API endpoint to test authentication
+        response = _probe_connection_data(_connection_data_url(organization), headers)
+        # Azure DevOps returns 302 redirect for invalid authentication
+        if response.status_code in (302, 401, 403):
+            raise AuthenticationError(invalid_message)
+        elif response.status_code >= 400:
+            raise AuthenticationError(status_message.format(status=response.status_code))
+        _remember_validated(organization, token)
     except httpx.RequestError as e:
         # Network errors during validation - let it pass for now
-        logger.warning("Could not validate PAT token due to network error", error=str(e))
+        logger.warning(network_message, error=str(e))
 
 
-def _validate_bearer_token(token: str, headers: dict) -> None:
-    """Validate Bearer token by making a test API call."""
-    organization = os.environ.get("AZDO_ORGANIZATION")
-    if not organization:
-        # Skip validation if no organization is available
-        return
+def _token_cache_path() -> Path:
+    """Return the on-disk bearer token cache location."""
+    return cache_dir() / "token.json"
 
-    # Skip validation for test organizations or if test mode is enabled
-    if organization == "test-org" or os.environ.get("BEHAVE_JSON_LOGGING") == "1":
-        # In test mode, let tokens pass (actual Azure credential validation happened already)
-        return
 
-    # Use a minimal API endpoint to test authentication
-    test_url = f"https://dev.azure.com/{organization}/_apis/connectionData"
+def _azure_cli_account() -> str:
+    """
+    Identify the Azure CLI's signed-in account and active subscription.
 
+    Returns an empty string when the Azure CLI profile is missing or unreadable.
+    """
+    config_dir = os.environ.get("AZURE_CONFIG_DIR") or Path.home() / ".azure"
     try:
-        with httpx.Client(timeout=10.0, follow_redirects=False) as client:
-            response = client.get(test_url, headers=headers)
-            # Azure DevOps returns 302 redirect for invalid authentication
-            if response.status_code in (302, 401, 403):
-                raise AuthenticationError("Invalid Azure AD token - authentication failed")
-            elif response.status_code >= 400:
-                raise AuthenticationError(f"Bearer token validation failed with status {response.status_code}")
-    except httpx.RequestError as e:
-        # Network errors during validation - let it pass for now
-        logger.warning("Could not validate Bearer token due to network error", error=str(e))
+        # The Azure CLI writes its profile with a UTF-8 byte order mark
+        profile = json.loads((Path(config_dir) / "azureProfile.json").read_text(encoding="utf-8-sig"))
+        subscriptions = profile.get("subscriptions") or []
+    except (OSError, ValueError, AttributeError):
+        return ""
+    for subscription in subscriptions:
+        if isinstance(subscription, dict) and subscription.get("isDefault"):
+            user = subscription.get("user") or {}
+            return f"{user.get('name', '')}|{subscription.get('tenantId', '')}|{subscription.get('id', '')}"
+    return ""
+
+
+def _token_cache_key(scope: str) -> str:
+    """
+    Key cached tokens by the identity they were issued to and the scope.
+
+    The identity covers the credential class, the tenant and client ID settings
+    and the Azure CLI account, so signing in as someone else, switching
+    subscriptions or selecting another credential never reuses the old token.
+    """
+    identity = "|".join((
+        _credential_class_name(),
+        os.environ.get("AZURE_TENANT_ID", ""),
+        os.environ.get("AZURE_CLIENT_ID", ""),
+        _azure_cli_account(),
+    ))
+    return f"{hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()}|{scope}"
+
+
+def _load_cached_token(scope: str) -> tuple[str, float] | None:
+    """Return a cached (bearer token, expires_on) for the scope if it is still comfortably valid."""
+    try:
+        entry = json.loads(_token_cache_path().read_text()).get(_token_cache_key(scope))
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    if not entry or not entry.get("token") or entry.get("expires_on", 0) - time.time() <= TOKEN_REFRESH_MARGIN_SECONDS:
+        return None
+    return entry["token"], entry["expires_on"]
+
+
+def _store_cached_token(scope: str, token: str, expires_on: int) -> None:
+    """Persist a bearer token so later invocations can skip the credential chain."""
+    cache_path = _token_cache_path()
+    try:
+        try:
+            cache = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        cache[_token_cache_key(scope)] = {"token": token, "expires_on": expires_on}
+        write_private_file(cache_path, json.dumps(cache).encode())
+    except OSError as e:
+        logger.warning("Could not write token cache", error=str(e))
+
+
+def _discard_cached_token(scope: str) -> None:
+    """Remove a cached bearer token, e.g. after it was rejected."""
+    cache_path = _token_cache_path()
+    try:
+        cache = json.loads(cache_path.read_text())
+        if isinstance(cache, dict) and cache.pop(_token_cache_key(scope), None) is not None:
+            write_private_file(cache_path, json.dumps(cache).encode())
+    except (OSError, ValueError):
+        pass
+
+
+def basic_auth_header(pat: str) -> str:
+    """
+    Return the Basic Authorization header value for a Personal Access Token.
+
+    Azure DevOps expects the PAT as the password with an empty username. The
+    value is not memoized, so no raw PAT is kept alive by a cache.
+    """
+    return "Basic " + base64.b64encode(b":" + pat.encode()).decode("ascii")
 
 
 def _authenticate_with_pat(pat: str) -> tuple[dict, str]:
     """Authenticate using Personal Access Token."""
     try:
-        basic = base64.b64encode(f":{pat}".encode()).decode()
-        headers = {"Authorization": f"Basic {basic}"}
+        headers = {"Authorization": basic_auth_header(pat)}
         credential_source = "PAT"
 
         # Validate PAT by testing with a simple API call
-        _validate_pat_token(pat, headers)
+        _validate_token("PAT", pat, headers)
 
         _log_auth_success(credential_source, headers)
         return headers, credential_source
@@ -125,28 +302,84 @@ def _authenticate_with_pat(pat: str) -> tuple[dict, str]:
         raise AuthenticationError("PAT authentication failed") from e
 
 
-def _authenticate_with_azure_ad() -> tuple[dict, str]:
-    """Authenticate using DefaultAzureCredential."""
+def _credential_class_name() -> str:
+    """
+    Return the azure.identity credential class selected by AZDO_CREDENTIAL_CLASS.
+
+    Raises:
+        AuthenticationError: If AZDO_CREDENTIAL_CLASS names an unsupported class
+    """
+    class_name = os.environ.get("AZDO_CREDENTIAL_CLASS") or "DefaultAzureCredential"
+    if class_name not in AAD_CREDENTIAL_CLASSES:
+        raise AuthenticationError(
+            f"Unsupported AZDO_CREDENTIAL_CLASS '{class_name}'. Choose one of: {', '.join(sorted(AAD_CREDENTIAL_CLASSES))}"
+        )
+    return class_name
+
+
+@cache
+def _aad_credential() -> "TokenCredential":
+    """
+    Return the process-wide Azure AD credential, creating it on first use.
+
+    Reusing one instance avoids re-walking the credential chain on every call and
+    lets the credential's own in-memory token cache take effect. Deployed
+    environments can set AZDO_CREDENTIAL_CLASS (e.g. ManagedIdentityCredential)
+    to use one deterministic credential instead of the DefaultAzureCredential chain.
+
+    Raises:
+        AuthenticationError: If AZDO_CREDENTIAL_CLASS names an unsupported class
+    """
+    class_name = _credential_class_name()
+
+    import azure.identity
+
+    # One factory per AAD_CREDENTIAL_CLASSES entry; azure.identity is only imported once one is needed
+    factories: dict[str, Callable[[], "TokenCredential"]] = {
+        "DefaultAzureCredential": partial(
+            azure.identity.DefaultAzureCredential, exclude_interactive_browser_credential=True
+        ),
+        "ManagedIdentityCredential": azure.identity.ManagedIdentityCredential,
+        "AzureCliCredential": azure.identity.AzureCliCredential,
+        "EnvironmentCredential": azure.identity.EnvironmentCredential,
+        "WorkloadIdentityCredential": azure.identity.WorkloadIdentityCredential,
+    }
+    return factories[class_name]()
+
+
+def _authenticate_with_azure_ad() -> tuple[dict, str, float]:
+    """Authenticate using the selected Azure AD credential, returning headers, source and token expiry."""
+    # Reported until the configured credential class is known
+    credential_source = "DefaultAzureCredential"
     try:
         # Check for test flag to simulate no Azure credentials
         if os.environ.get("TEST_SIMULATE_NO_AZURE_CREDENTIALS") == "true":
             raise Exception("Simulated: No Azure credentials available")
 
-        from azure.identity import DefaultAzureCredential
+        # Report a misconfigured credential even when a cached token exists
+        credential_source = _credential_class_name()
+        cached_token = _load_cached_token(AZURE_DEVOPS_SCOPE)
+        if cached_token is not None:
+            token, expires_on = cached_token
+        else:
+            access_token = _aad_credential().get_token(AZURE_DEVOPS_SCOPE)
+            token, expires_on = access_token.token, access_token.expires_on
+            _store_cached_token(AZURE_DEVOPS_SCOPE, token, access_token.expires_on)
 
-        credential = DefaultAzureCredential()
-        token = credential.get_token(AZURE_DEVOPS_SCOPE)
-        headers = {"Authorization": f"Bearer {token.token}"}
-        credential_source = "DefaultAzureCredential"
+        headers = {"Authorization": f"Bearer {token}"}
 
         # Validate token by testing with a simple API call
-        _validate_bearer_token(token.token, headers)
+        try:
+            _validate_token("Bearer", token, headers)
+        except AuthenticationError:
+            _discard_cached_token(AZURE_DEVOPS_SCOPE)
+            raise
 
         _log_auth_success(credential_source, headers)
-        return headers, credential_source
+        return headers, credential_source, expires_on
 
     except Exception as e:
-        _log_auth_failure("DefaultAzureCredential", e, "Azure AD authentication failed")
+        _log_auth_failure(credential_source, e, "Azure AD authentication failed")
         raise AuthenticationError("Azure AD authentication failed") from e
 
 
@@ -159,19 +392,64 @@ def get_credentials(pat: str | None = None) -> tuple[dict, str]:
              If None, uses DefaultAzureCredential for Bearer token.
 
     Returns:
-        Tuple of (auth_headers, credential_source)
+        Tuple of (auth_headers, credential_source). Results are cached for
+        VALIDATION_TTL_SECONDS, and bearer tokens never past shortly before
+        they expire, so a credential is revalidated on the same schedule as
+        a fresh one.
 
     Raises:
         AuthenticationError: If authentication fails
     """
+    cache_key = f"pat:{hashlib.blake2b(pat.encode(), digest_size=16).hexdigest()}" if pat else f"aad:{AZURE_DEVOPS_SCOPE}"
+    with _credential_cache_lock:
+        cached = _credential_cache.get(cache_key)
+    if cached is not None and cached[2] > time.time():
+        headers, credential_source, _ = cached
+        return dict(headers), credential_source
+
+    validation_expires_at = time.time() + VALIDATION_TTL_SECONDS
     if pat:
-        return _authenticate_with_pat(pat)
+        headers, credential_source = _authenticate_with_pat(pat)
+        expires_at = validation_expires_at
     else:
-        return _authenticate_with_azure_ad()
+        headers, credential_source, expires_on = _authenticate_with_azure_ad()
+        expires_at = min(expires_on - TOKEN_REFRESH_MARGIN_SECONDS, validation_expires_at)
+
+    with _credential_cache_lock:
+        _credential_cache[cache_key] = (dict(headers), credential_source, expires_at)
+    return headers, credential_source
+
+
+def clear_credential_cache() -> None:
+    """
+    Forget credentials, token validations and settings cached for this process.
+
+    The next get_credentials call authenticates from scratch, e.g. after a PAT
+    was rotated or AZDO_ORGANIZATION changed. The on-disk token cache is kept.
+    """
+    with _credential_cache_lock:
+        _credential_cache.clear()
+    _validated_tokens.clear()
+    _organization.cache_clear()
+    _aad_credential.cache_clear()
+    _test_json_enabled.cache_clear()
+
+
+async def get_credentials_async(pat: str | None = None) -> tuple[dict, str]:
+    """
+    Async variant of get_credentials for callers already running an event loop.
 
+    Credential acquisition and validation run in a worker thread so the event
+    loop is not blocked; results share the same process-level cache.
 
-# Backwards compatibility - deprecated
-def get_auth_headers(pat: str | None = None) -> dict:
-    """Deprecated: Use get_credentials() instead."""
-    headers, _ = get_credentials(pat)
-    return headers
+    Args:
+        pat: Personal Access Token. If provided, uses Basic Auth.
+             If None, uses DefaultAzureCredential for Bearer token.
+
+    Returns:
+        Tuple of (auth_headers, credential_source)
+
+    Raises:
+        AuthenticationError: If authentication fails
+    """
+    return await asyncio.to_thread(get_credentials, pat)
@@ -0,0 +1,115 @@
+"""
+On-disk caches for Azure DevOps process export.
+
+Provides the per-user cache directory and an ETag-keyed response cache used to
+turn repeated REST requests for unchanged resources into cheap 304 responses.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from azdo_process_export.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def cache_dir() -> Path:
+    """Return the per-user cache directory, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "azdo-process-export"
+
+
+def write_private_file(path: Path, data: bytes) -> None:
+    """
+    Atomically write a file readable only by the current user.
+
+    Args:
+        path: Destination file path
+        data: File contents
+    """
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    # Write to a private temp file and rename so readers never see a partial file
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and the ETag it was served with."""
+
+    etag: str
+    body: bytes
+
+
+class ETagCache:
+    """
+    Persistent cache of response bodies keyed by request URL and validated by ETag.
+
+    The index of URL -> ETag lives in etags.json; each body is stored in its own
+    file so a lookup only reads the body it needs.
+    """
+
+    def __init__(self, directory: Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: <cache_dir()>/responses)
+        """
+        self.directory = directory or cache_dir() / "responses"
+        self._index_path = self.directory / "etags.json"
+        self._index: dict[str, str] | None = None
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key, typically the request URL
+
+        Returns:
+            The cached response, or None if there is no usable entry
+        """
+        etag = self._load_index().get(key)
+        if etag is None:
+            return None
+        try:
+            body = self._body_path(key).read_bytes()
+        except OSError:
+            return None
+        return CachedResponse(etag=etag, body=body)
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        """
+        Store a response body under its ETag.
+
+        Args:
+            key: Cache key, typically the request URL
+            etag: ETag header value returned with the body
+            body: Raw response body
+        """
+        index = self._load_index()
+        try:
+            write_private_file(self._body_path(key), body)
+            index[key] = etag
+            write_private_file(self._index_path, json.dumps(index).encode())
+        except OSError as e:
+            logger.warning("Could not write response cache", error=str(e))
+
+    def _load_index(self) -> dict[str, str]:
+        if self._index is None:
+            try:
+                index = json.loads(self._index_path.read_text())
+            except (OSError, ValueError):
+                index = {}
+            self._index = index if isinstance(index, dict) else {}
+        return self._index
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
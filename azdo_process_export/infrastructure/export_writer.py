@@ -0,0 +1,150 @@
+"""
+JSON export writer for Azure DevOps process exports.
+
+Serializes a ProcessExport to the output file using orjson, writing the
+encoded bytes directly instead of going through a text buffer. Large exports
+can be written incrementally with ExportStreamWriter so that only one record
+is held in encoded form at a time.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+import orjson
+
+from azdo_process_export.domain.models import ProcessExport, orjson_default
+
+# Export documents are indented; ProcessExport.to_json_bytes handles the camelCase mapping
+EXPORT_JSON_OPTIONS = orjson.OPT_INDENT_2
+
+# Streamed records are written compactly; indentation would need per-depth re-encoding.
+# Dataclasses are passed to models.orjson_default so domain models get the same camelCase
+# keys and datetime format as ProcessExport.to_json_bytes().
+STREAM_JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS
+
+# Number of streamed records between explicit flushes of the output file
+STREAM_FLUSH_EVERY = 500
+
+
+def serialize_export(export: ProcessExport) -> bytes:
+    """
+    Serialize a process export to JSON bytes.
+
+    Args:
+        export: The process export to serialize
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    return export.to_json_bytes(option=EXPORT_JSON_OPTIONS)
+
+
+def write_export(export: ProcessExport, out: Path) -> None:
+    """
+    Write a process export to a JSON file.
+
+    Args:
+        export: The process export to write
+        out: Output file path
+    """
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(serialize_export(export))
+
+
+class ExportStreamWriter:
+    """
+    Incrementally write a JSON object to a file.
+
+    Top-level members are written as they become available; array members are
+    written one record at a time so the full export never has to exist as a
+    single Python object graph.
+
+    Example:
+        >>> with ExportStreamWriter(Path("process.json")) as writer:
+        ...     writer.write_value("exportedAt", exported_at)
+        ...     writer.write_records("teams", fetch_teams())
+    """
+
+    def __init__(self, out: Path, flush_every: int = STREAM_FLUSH_EVERY):
+        """
+        Initialize the stream writer.
+
+        Args:
+            out: Output file path
+            flush_every: Number of records written between flushes
+        """
+        self.out = out
+        self.flush_every = flush_every
+        self._file: BinaryIO | None = None
+        self._member_count = 0
+
+    def __enter__(self) -> "ExportStreamWriter":
+        self.out.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.out.open("wb")
+        self._file.write(b"{")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._file is None:
+            return
+        if exc_type is None:
+            self._file.write(b"}\n")
+        self._file.close()
+        self._file = None
+
+    def write_value(self, key: str, value: Any) -> None:
+        """
+        Write a single top-level member.
+
+        Args:
+            key: Member name
+            value: JSON-serializable value
+        """
+        self._write_key(key)
+        self._output.write(orjson.dumps(value, default=orjson_default, option=STREAM_JSON_OPTIONS))
+
+    def write_records(self, key: str, records: Iterable[Any]) -> int:
+        """
+        Write a top-level array member, encoding one record at a time.
+
+        Args:
+            key: Member name
+            records: Iterable of JSON-serializable records, consumed lazily
+
+        Returns:
+            Number of records written
+        """
+        output = self._output
+        self._write_key(key)
+        output.write(b"[")
+        count = 0
+        for record in records:
+            if count:
+                output.write(b",")
+            output.write(orjson.dumps(record, default=orjson_default, option=STREAM_JSON_OPTIONS))
+            count += 1
+            if count % self.flush_every == 0:
+                output.flush()
+        output.write(b"]")
+        return count
+
+    @property
+    def _output(self) -> BinaryIO:
+        if self._file is None:
+            raise RuntimeError("ExportStreamWriter must be used as a context manager")
+        return self._file
+
+    def _write_key(self, key: str) -> None:
+        output = self._output
+        if self._member_count:
+            output.write(b",")
+        output.write(orjson.dumps(key))
+        output.write(b":")
+        self._member_count += 1
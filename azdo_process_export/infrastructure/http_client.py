@@ -5,18 +5,25 @@ This module provides a simple HTTP client for making async requests to Azure Dev
 Follows Azure DevOps REST API patterns with proper authentication and error handling.
 """
 
-import base64
-from typing import Any, Dict, List
-import structlog
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from types import TracebackType
+from typing import Any
 
 import httpx
+import orjson
 
+from azdo_process_export.infrastructure.auth import basic_auth_header
+from azdo_process_export.infrastructure.logging import get_logger
 
 # Constants
 DEFAULT_API_VERSION = "7.0"
 BASE_URL_TEMPLATE = "https://dev.azure.com/{organization}"
+CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+PROJECTS_PAGE_SIZE = 1000
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class AzureDevOpsClient:
@@ -26,9 +33,14 @@ class AzureDevOpsClient:
     Provides basic operations for interacting with Azure DevOps REST APIs
     using Personal Access Token authentication.
     
+    A pooled connection is kept open for as long as the client is used from
+    the same event loop, so use it as an async context manager (or call
+    aclose()) to release it. Using the client from a new loop, e.g. with
+    repeated asyncio.run() calls, transparently opens a new pool.
+
     Example:
-        >>> client = AzureDevOpsClient("my-org", "my-pat")
-        >>> projects = await client.list_projects()
+        >>> async with AzureDevOpsClient("my-org", "my-pat") as client:
+        ...     projects = await client.list_projects()
         >>> print(f"Found {len(projects)} projects")
     """
 
@@ -53,6 +65,8 @@ class AzureDevOpsClient:
         self.api_version = api_version
         self.base_url = BASE_URL_TEMPLATE.format(organization=self.organization)
         self.headers = self._create_auth_headers(pat)
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
         
         logger.info(
             "Azure DevOps client initialized",
@@ -61,41 +75,133 @@ class AzureDevOpsClient:
             api_version=self.api_version
         )
 
-    def _create_auth_headers(self, pat: str) -> Dict[str, str]:
+    def _create_auth_headers(self, pat: str) -> httpx.Headers:
         """
         Create authentication headers for Azure DevOps API requests.
         
         Azure DevOps expects Basic authentication with PAT as username
-        and empty password, base64 encoded.
+        and empty password, base64 encoded. The PAT is encoded once here and
+        the headers are built as an httpx.Headers instance, so the shared client
+        does not convert them again.
         
         Args:
             pat: Personal Access Token
             
         Returns:
-            Dictionary of HTTP headers for authentication
+            HTTP headers for authentication
         """
         # Azure DevOps PAT format: ':PAT' (empty username, PAT as password)
-        auth_string = f":{pat.strip()}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        return {
-            "Authorization": f"Basic {auth_b64}",
+        return httpx.Headers({
+            "Authorization": basic_auth_header(pat.strip()),
             "Content-Type": "application/json",
             "Accept": "application/json",
             "User-Agent": "azdo-process-export/0.1.0"
-        }
+        })
 
-    async def list_projects(self) -> List[Dict[str, Any]]:
+    async def _get_client(self) -> httpx.AsyncClient:
         """
-        List all projects in the Azure DevOps organization.
+        Return the shared pooled HTTP client, creating it on first use.
+
+        HTTP/2 is enabled so concurrent requests are multiplexed over a single
+        TLS connection to dev.azure.com. The pooled connections belong to the
+        event loop that opened them, so a new client is created when the client
+        is used from a different loop (e.g. successive asyncio.run() calls).
+
+        Returns:
+            The long-lived httpx.AsyncClient bound to this organization
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # A client from an earlier loop cannot be closed from this one; its
+            # connections were released when that loop shut down
+            self._client_loop = loop
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                http2=True,
+                limits=CONNECTION_LIMITS,
+                timeout=REQUEST_TIMEOUT,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its connections."""
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> "AzureDevOpsClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def _get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """
+        GET a JSON resource from the organization using the shared client.
+
+        Args:
+            path: API path relative to the organization URL, e.g. '/_apis/process/processes'
+            params: Extra query parameters; api-version is added automatically
+
+        Returns:
+            The "value" array of a list response, otherwise the decoded document
+
+        Raises:
+            httpx.HTTPStatusError: If the API request fails (4xx/5xx status)
+            httpx.RequestError: If there's a network or connection error
+        """
+        client = await self._get_client()
+        response = await client.get(path, params={"api-version": self.api_version, **(params or {})})
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        if isinstance(data, dict) and "value" in data:
+            return data["value"]
+        return data
+
+    async def fetch_many(self, specs: Iterable[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        """
+        Fetch several independent resources concurrently.
+
+        All requests share the pooled HTTP/2 client, so they are multiplexed over
+        one connection and complete in roughly the time of the slowest request.
+
+        Args:
+            specs: (path, params) pairs, as accepted by _get_json
+
+        Returns:
+            Results in the same order as specs
+
+        Raises:
+            httpx.HTTPStatusError: If any API request fails (4xx/5xx status)
+            httpx.RequestError: If there's a network or connection error
+
+        Example:
+            >>> processes, fields = await client.fetch_many([
+            ...     ("/_apis/process/processes", None),
+            ...     ("/_apis/wit/fields", None),
+            ... ])
+        """
+        return list(await asyncio.gather(*(self._get_json(path, params) for path, params in specs)))
+
+    async def iter_projects(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all projects in the Azure DevOps organization, page by page.
         
-        Makes an async GET request to /_apis/projects endpoint to retrieve
-        all projects accessible to the authenticated user.
+        Requests /_apis/projects in pages of PROJECTS_PAGE_SIZE and follows the
+        x-ms-continuationtoken response header, yielding each project as soon as
+        its page arrives so only one page is held in memory at a time.
         
-        Returns:
-            List of project dictionaries containing project metadata.
-            Each project dict includes: id, name, description, url, state, etc.
+        Yields:
+            Project dictionaries containing project metadata.
             
         Raises:
             httpx.HTTPStatusError: If the API request fails (4xx/5xx status)
@@ -103,34 +209,32 @@ class AzureDevOpsClient:
             ValueError: If the response format is unexpected
             
         Example:
-            >>> projects = await client.list_projects()
-            >>> for project in projects:
+            >>> async for project in client.iter_projects():
             ...     print(f"Project: {project['name']} (ID: {project['id']})")
         """
         url = f"{self.base_url}/_apis/projects"
-        params = {"api-version": self.api_version}
-        
-        logger.debug(
-            "Making request to list projects",
-            url=url,
-            params=params
-        )
+        params: dict[str, str | int] = {"api-version": self.api_version, "$top": PROJECTS_PAGE_SIZE}
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                projects = data.get("value", [])
-                
-                logger.info(
-                    "Successfully retrieved projects",
-                    project_count=len(projects),
-                    status_code=response.status_code
+            client = await self._get_client()
+            while True:
+                logger.debug(
+                    "Making request to list projects",
+                    url=url,
+                    params=params
                 )
-                
-                return projects
+
+                response = await client.get("/_apis/projects", params=params)
+                response.raise_for_status()
+
+                projects = orjson.loads(response.content).get("value", [])
+                for project in projects:
+                    yield project
+
+                continuation_token = response.headers.get("x-ms-continuationtoken")
+                if not continuation_token or not projects:
+                    return
+                params = {**params, "continuationToken": continuation_token}
                 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -147,10 +251,39 @@ class AzureDevOpsClient:
                 url=url
             )
             raise
-        except (KeyError, TypeError, ValueError) as e:
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
             logger.error(
                 "Invalid response format while listing projects",
                 error=str(e),
                 url=url
             )
             raise ValueError(f"Unexpected response format from Azure DevOps API: {e}")
+
+    async def list_projects(self) -> list[dict[str, Any]]:
+        """
+        List all projects in the Azure DevOps organization.
+
+        Collects every page from iter_projects() into a single list.
+
+        Returns:
+            List of project dictionaries containing project metadata.
+            Each project dict includes: id, name, description, url, state, etc.
+
+        Raises:
+            httpx.HTTPStatusError: If the API request fails (4xx/5xx status)
+            httpx.RequestError: If there's a network or connection error
+            ValueError: If the response format is unexpected
+
+        Example:
+            >>> projects = await client.list_projects()
+            >>> for project in projects:
+            ...     print(f"Project: {project['name']} (ID: {project['id']})")
+        """
+        projects = [project async for project in self.iter_projects()]
+
+        logger.info(
+            "Successfully retrieved projects",
+            project_count=len(projects)
+        )
+
+        return projects
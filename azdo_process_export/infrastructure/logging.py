@@ -5,13 +5,203 @@ Provides consistent JSON logging across all modules following Better Stack guida
 Supports different log levels (info, debug, trace) and outputs to stdout and optional file.
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
+import queue
+import re
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import FrameType
+from typing import Any, TextIO, cast
 
+import orjson
 import structlog
 
+# Bound on queued log records; when full, records below WARNING are dropped rather than blocking
+LOG_QUEUE_SIZE = 10000
+
+# Frames from files whose path matches this are skipped when locating the caller
+_TRACE_SKIP_PATTERN = re.compile(r"logging|structlog")
+
+# Per-thread cache of the thread name; current_thread() takes a lock on every call
+_thread_local = threading.local()
+
+# Records buffered per output before they are written in a single write() call
+LOG_BATCH_SIZE = 512
+
+# Write buffer for the log file; batches are flushed explicitly, so this only bounds syscall size
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# Background listener writing queued records to the real handlers
+_listener: "_BatchingQueueListener | None" = None
+
+# Root handler feeding the listener's queue
+_queue_handler: "_BoundedQueueHandler | None" = None
+
+# The structlog processor chain. Loggers are cached on first use and keep a reference to
+# this list, so reconfiguration updates it in place rather than replacing it.
+_processors: list[Any] = []
+
+# Arguments of the last completed setup_logging call
+_config_fingerprint: tuple[Any, ...] | None = None
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that does not block on routine records when the queue is full.
+
+    Records below WARNING are dropped and counted while the queue is full; warnings
+    and errors wait for space, so they are never lost. The number of dropped records
+    is reported as a warning once the queue has room again.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        important = record.levelno >= logging.WARNING
+        if self._dropped:
+            self.report_dropped(block=important)
+        if important:
+            self._log_queue.put(record)
+            return
+        try:
+            self._log_queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def report_dropped(self, block: bool = True) -> None:
+        """
+        Queue a warning with the number of records dropped since the last report.
+
+        Args:
+            block: Wait for room in the queue; otherwise keep the count for a later report
+        """
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if not dropped:
+            return
+        try:
+            self._log_queue.put(_dropped_records_notice(dropped), block=block)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += dropped
+
+
+def _dropped_records_notice(dropped: int) -> logging.LogRecord:
+    """Build an already-rendered warning record reporting dropped log records."""
+    event_dict = {"event": "Log records dropped", "dropped": dropped, "logger": __name__, "level": "warning"}
+    stamped = structlog.processors.TimeStamper(fmt="iso")(None, "warning", event_dict)
+    return logging.makeLogRecord({
+        "name": __name__,
+        "levelno": logging.WARNING,
+        "levelname": "WARNING",
+        "msg": _orjson_dumps(dict(stamped)),
+    })
+
+
+class _BatchHandler(logging.handlers.MemoryHandler):
+    """
+    Buffer records and write them to the target stream handler in one write() per batch.
+
+    A plain MemoryHandler replays buffered records through target.handle(), which
+    still writes and flushes once per record; this joins the rendered batch instead.
+    """
+
+    def __init__(self, target: logging.StreamHandler):
+        super().__init__(LOG_BATCH_SIZE, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.setLevel(target.level)
+
+    def flush(self) -> None:
+        # acquire()/release() rather than `with self.lock`, which is typed Optional
+        self.acquire()
+        try:
+            target = self.target
+            if not self.buffer or not isinstance(target, logging.StreamHandler):
+                return
+            records, self.buffer = self.buffer, []
+            try:
+                # QueueHandler.prepare() already rendered each message into record.msg,
+                # so the target's Formatter is bypassed
+                batch = "".join(record.msg + target.terminator for record in records)
+                target.acquire()
+                try:
+                    if isinstance(target, logging.handlers.WatchedFileHandler):
+                        # Pick up a new file if the log was rotated since the last batch
+                        target.reopenIfNeeded()
+                    target.stream.write(batch)
+                    target.flush()
+                finally:
+                    target.release()
+            except Exception:
+                target.handleError(records[0])
+        finally:
+            self.release()
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes to whatever sys.stdout is at write time.
+
+    Callers such as Click's CliRunner swap sys.stdout between runs; resolving it
+    per write keeps one logging setup valid across those swaps.
+    """
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self) -> TextIO:
+        return sys.stdout
+
+
+class _BufferedFileHandler(logging.handlers.WatchedFileHandler):
+    """WatchedFileHandler whose file is opened with a large write buffer."""
+
+    def _open(self) -> io.TextIOWrapper:
+        # The handler's mode is always a text mode, so open() returns a TextIOWrapper
+        return cast(
+            io.TextIOWrapper,
+            open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE, encoding=self.encoding, errors=self.errors),
+        )
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its batching handlers whenever the queue runs dry."""
+
+    def __init__(
+        self, log_queue: "queue.Queue[logging.LogRecord]", *handlers: logging.Handler, respect_handler_level: bool
+    ):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        # The base class types its queue as a put/get-only protocol; keep the concrete queue
+        self._log_queue = log_queue
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        # Under load records accumulate into full batches; once idle, write out promptly
+        if self._log_queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+    def join(self) -> None:
+        """Block until every queued record has been handled and written."""
+        self._log_queue.join()
+
+    def stop(self) -> None:
+        super().stop()
+        self.flush()
+
 
 def setup_logging(
     log_level: str = "info",
@@ -26,6 +216,12 @@ def setup_logging(
         log_file: Optional file path for log output
         enable_trace: Enable trace-level logging
     """
+    global _config_fingerprint
+    # Repeated calls with the same settings keep the current setup
+    fingerprint = (log_level.lower(), log_file, enable_trace)
+    if fingerprint == _config_fingerprint and _listener is not None:
+        return
+
     # Map string levels to logging constants
     level_map = {
         "info": logging.INFO,
@@ -35,15 +231,20 @@ def setup_logging(
 
     level = level_map.get(log_level.lower(), logging.INFO)
 
-    # Configure standard library logging to use stdout
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=level,
-        force=True  # Override any existing configuration
-    )
+    # Log records are handed to a bounded queue and written to stdout (and the optional
+    # file) by a background listener, keeping stream and file writes off the calling thread
+    stdout_handler = _StdoutHandler()
+    stdout_handler.setLevel(level)
+    handlers: list[logging.StreamHandler] = [stdout_handler]
+
+    # Configure file logging if specified
+    if log_file:
+        handlers.append(_setup_file_logging(log_file, level))
+
+    _start_queue_listener(handlers, level)
 
-    # Configure structlog
+    # Configure structlog. Level filtering runs first so records that will not be
+    # emitted skip the rest of the chain.
     processors = [
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
@@ -59,69 +260,129 @@ def setup_logging(
     if enable_trace or log_level.lower() == "trace":
         processors.append(_add_trace_context)
 
-    # Use JSON renderer for structured output
-    processors.append(structlog.processors.JSONRenderer())
+    # Use JSON renderer for structured output, encoded by orjson
+    processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
 
+    _processors[:] = processors
     structlog.configure(
-        processors=processors,
+        processors=_processors,
         wrapper_class=structlog.stdlib.BoundLogger,
         logger_factory=structlog.stdlib.LoggerFactory(),
         context_class=dict,
         cache_logger_on_first_use=True,
     )
+    _config_fingerprint = fingerprint
 
-    # Configure file logging if specified
-    if log_file:
-        _setup_file_logging(log_file, level)
+
+def _orjson_dumps(event_dict: dict, **kwargs: Any) -> str:
+    """Serialize an event dict with orjson; the stdlib handlers expect a str message."""
+    return orjson.dumps(event_dict, **kwargs).decode()
+
+
+def _start_queue_listener(handlers: list[logging.StreamHandler], level: int) -> None:
+    """Route the root logger through a queue drained by a listener thread writing to handlers."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        # Reconfiguration: drain and stop the previous listener before replacing it
+        _report_dropped_records()
+        _listener.stop()
+    else:
+        atexit.register(_stop_queue_listener)
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = _queue_handler = _BoundedQueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Swap the root handlers directly rather than through basicConfig(force=True)
+    root = logging.getLogger()
+    for old_handler in root.handlers:
+        old_handler.close()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level)
+
+    batch_handlers = [_BatchHandler(handler) for handler in handlers]
+    _listener = _BatchingQueueListener(log_queue, *batch_handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def flush_logging() -> None:
+    """Block until every queued log record has been written to its outputs."""
+    if _listener is not None:
+        _listener.join()
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener at interpreter exit."""
+    global _listener
+    if _listener is not None:
+        _report_dropped_records()
+        _listener.stop()
+        _listener = None
+
+
+def _report_dropped_records() -> None:
+    """Report records dropped since the last report before the listener stops."""
+    if _queue_handler is not None:
+        _queue_handler.report_dropped()
 
 
 def _add_trace_context(logger: Any, name: str, event_dict: dict) -> dict:
     """Add trace context information to log entries."""
-    import threading
-    import traceback
+    thread_name = getattr(_thread_local, "name", None)
+    if thread_name is None:
+        thread_name = _thread_local.name = threading.current_thread().name
 
-    event_dict["trace"] = {
+    trace = event_dict["trace"] = {
         "thread_id": threading.get_ident(),
-        "thread_name": threading.current_thread().name,
+        "thread_name": thread_name,
     }
 
-    # Add stack trace for debug/trace levels
-    if event_dict.get("level") in ("debug", "trace"):
-        stack = traceback.extract_stack()
-        # Get the caller frame (skip logging infrastructure frames)
-        caller_frame = None
-        for frame in reversed(stack):
-            if not any(skip in frame.filename for skip in ["logging", "structlog"]):
-                caller_frame = frame
-                break
-
-        if caller_frame:
-            event_dict["trace"]["caller"] = {
-                "filename": caller_frame.filename,
-                "line": caller_frame.lineno,
-                "function": caller_frame.name,
-            }
+    # Add the caller location for debug/trace levels only
+    if event_dict.get("level") not in ("debug", "trace"):
+        return event_dict
+
+    # Walk outwards from this frame to the first caller outside the logging
+    # infrastructure, without materializing the whole stack
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None and _is_logging_frame(frame.f_code.co_filename):
+        frame = frame.f_back
+
+    if frame is not None:
+        trace["caller"] = {
+            "filename": frame.f_code.co_filename,
+            "line": frame.f_lineno,
+            "function": frame.f_code.co_name,
+        }
 
     return event_dict
 
 
-def _setup_file_logging(log_file: Path, level: int) -> None:
-    """Setup file logging handler."""
+@lru_cache(maxsize=256)
+def _is_logging_frame(filename: str) -> bool:
+    """Return True for source files belonging to the logging infrastructure."""
+    return _TRACE_SKIP_PATTERN.search(filename) is not None
+
+
+def _setup_file_logging(log_file: Path, level: int) -> logging.FileHandler:
+    """Setup file logging handler, reopening the file if it is rotated externally."""
     # Ensure directory exists
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Add file handler to root logger
-    file_handler = logging.FileHandler(log_file)
+    # The handler is attached to the queue listener by setup_logging
+    file_handler = _BufferedFileHandler(log_file)
     file_handler.setLevel(level)
-    file_handler.setFormatter(logging.Formatter("%(message)s"))
 
-    logging.getLogger().addHandler(file_handler)
+    return file_handler
 
 
+@lru_cache(maxsize=128)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
     Get a properly configured logger for a module.
     
+    Loggers are cached per name; they resolve the structlog configuration
+    lazily, so a cached logger still follows a later setup_logging call.
+    
     Args:
         name: Logger name, typically __name__
         
@@ -131,6 +392,7 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+@lru_cache(maxsize=128)
 def get_trace_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
     Get a logger with trace-level context enabled.
@@ -141,5 +403,5 @@ def get_trace_logger(name: str) -> structlog.stdlib.BoundLogger:
     Returns:
         Configured structlog logger with trace context
     """
-    logger = structlog.get_logger(name)
-    return logger.bind(trace_enabled=True)
+    # Pass the context as initial values rather than bind() so the cached logger stays lazy
+    return structlog.get_logger(name, trace_enabled=True)
@@ -22,6 +22,7 @@ Feature: Authentication Methods
         And the structured log should contain authentication success with DefaultAzureCredential credential source
         And the authentication headers should contain Bearer authorization
 
+    @subprocess
     Scenario: Authentication fails with invalid PAT token
         Given I have an invalid Personal Access Token
         And the environment variable "AZDO_ORGANIZATION" is set to "test-org"
@@ -25,11 +25,17 @@ Feature: Basic CLI Functionality
         And the output should contain "--pat"
         And the output should contain "--skip-metrics"
 
+    Scenario: Run the CLI as a Python module
+        When I run "python -m azdo_process_export.cli.main --version"
+        Then the exit code should be 0
+        And the output should contain "0.1.0"
+
     Scenario: Require project name argument
         When I run "azdo-process-export process"
         Then the exit code should be 2
         And the output should contain "Missing argument"
 
+    @subprocess
     Scenario: Require organization configuration
         When I run "azdo-process-export process 'Test Project'"
         Then the exit code should be 1
@@ -0,0 +1,102 @@
+"""
+Fork server for Behave scenarios that need a real CLI process.
+
+Scenarios tagged ``@subprocess`` run through this worker (see
+features/steps/cli_steps.py); everything else invokes the CLI in-process.
+
+Imports the CLI once, then reads one JSON request per line from stdin:
+``{"argv": [...], "env": {...}, "cwd": "...", "timeout": 5}``. Each request runs in a
+forked child, so the command still gets its own process (exit codes,
+signals, atexit handlers) without paying interpreter startup and import
+cost every time. One JSON result line is written back per request:
+``{"exit": N, "stdout": "...", "stderr": "..."}``.
+"""
+
+import os
+import signal
+import sys
+import tempfile
+import time
+
+import orjson
+
+from azdo_process_export.cli.main import cli
+
+# Poll interval while waiting for a child to finish
+WAIT_INTERVAL_SECONDS = 0.005
+
+
+def _run_child(argv: list[str], env: dict[str, str], cwd: str, stdout_fd: int, stderr_fd: int) -> None:
+    """Run the CLI in the forked child; never returns."""
+    # Own process group so a timeout also kills anything the command spawned
+    os.setsid()
+    os.chdir(cwd)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        cli.main(args=argv, prog_name="azdo-process-export")
+    finally:
+        # SystemExit from click ends the child here with the command's exit code
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def _wait(pid: int, timeout: float) -> int | None:
+    """Wait for a child, returning its exit code or None if it timed out."""
+    deadline = time.monotonic() + timeout
+    while True:
+        waited, status = os.waitpid(pid, os.WNOHANG)
+        if waited:
+            return os.waitstatus_to_exitcode(status)
+        if time.monotonic() >= deadline:
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                # The child has not called setsid yet
+                os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            return None
+        time.sleep(WAIT_INTERVAL_SECONDS)
+
+
+def handle(request: dict) -> dict:
+    """
+    Run one CLI request in a forked child.
+
+    Args:
+        request: Request with argv, env, working directory and timeout
+
+    Returns:
+        Result with exit code and captured stdout/stderr
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        sys.stdout.flush()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(request["argv"], request["env"], request["cwd"], out.fileno(), err.fileno())
+            sys.exit(0)
+
+        exit_code = _wait(pid, request["timeout"])
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode("utf-8", "replace")
+        stderr = err.read().decode("utf-8", "replace")
+
+    if exit_code is None:
+        return {"exit": -1, "stdout": "", "stderr": "Command timed out"}
+    return {"exit": exit_code, "stdout": stdout, "stderr": stderr}
+
+
+def main() -> None:
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        result = handle(orjson.loads(line))
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+        sys.stdout.buffer.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+Feature: Columnar Export View
+    As a developer building metrics and CSV exports
+    I want the export's record lists as columns
+    So that bulk transforms can walk one list per attribute
+
+    Background:
+        Given I have a process export with teams, work item types and warnings
+
+    Scenario: Columns hold one value per record
+        When I convert the export to columns
+        Then every "workItemTypes" column should have 1 value
+        And the "workItemTypes" column "usageLast12M" should contain 42
+        And every "fields" column should have 0 values
+
+    Scenario: Team members are flattened into one table
+        When I convert the export to columns
+        Then every "teamMembers" column should have 1 value
+        And the "teamMembers" column "uniqueName" should contain "member@example.com"
+
+    Scenario: Column names match the exported record keys
+        When I convert the export to columns
+        Then the "workItemTypes" column names should match the exported record keys
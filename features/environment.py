@@ -5,17 +5,73 @@ Sets up test environment, fixtures, and cleanup for BDD scenarios.
 """
 
 import os
+import shutil
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from click.testing import CliRunner
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Scenario output lives on tmpfs when available to avoid disk syncs
+SCENARIO_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# Scenario directories pre-created per run; emptied and reused instead of recreated
+SCENARIO_DIR_POOL_SIZE = os.cpu_count() or 4
+
+
+def _make_cli_runner() -> CliRunner:
+    """Create a CliRunner that captures stdout and stderr separately."""
+    try:
+        return CliRunner(mix_stderr=False)
+    except TypeError:
+        # Click 8.2+ always captures stderr separately
+        return CliRunner()
+
+
+def _new_scenario_dir() -> str:
+    return tempfile.mkdtemp(prefix=f"azdo_export_test_{os.getpid()}_", dir=SCENARIO_TMP_ROOT)
+
+
+def _recycle_scenario_dir(pool: deque[str], path: str) -> None:
+    """Empty a scenario directory and return it to the pool, or remove it if that fails."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    # deque.append is thread-safe; the directory only becomes visible once empty
+    pool.append(path)
+
 
 def before_all(context):
     """Set up test environment before all scenarios."""
     # Enable test-specific JSON logging for authentication tests
     os.environ["BEHAVE_JSON_LOGGING"] = "1"
 
-    # Create temporary directory for test outputs
-    context.temp_dir = Path(tempfile.mkdtemp(prefix="azdo_export_test_"))
+    # Scenario directories are removed in the background while later scenarios run
+    context.cleanup_executor = ThreadPoolExecutor(max_workers=4)
+    context.scenario_dir_pool = deque(_new_scenario_dir() for _ in range(SCENARIO_DIR_POOL_SIZE))
+
+    # Import the CLI once; in-process scenarios
+    # share the command object and runner instead of paying the import per run
+    from azdo_process_export.cli.main import cli
+
+    context.cli_app = cli
+    context.cli_runner = _make_cli_runner()
+
+    # Base environment for CLI subprocesses, merged with scenario variables per run
+    context.base_env = dict(os.environ)
+    # Commands run in the scenario directory, so the package must be importable from anywhere
+    python_path = [str(PROJECT_ROOT), *filter(None, [os.environ.get("PYTHONPATH")])]
+    context.base_env["PYTHONPATH"] = os.pathsep.join(python_path)
 
     # Set default test organization and project
     context.test_organization = os.environ.get("AZDO_TEST_ORGANIZATION", "demo-org")
@@ -31,11 +87,10 @@ def before_all(context):
 
 def after_all(context):
     """Clean up test environment after all scenarios."""
-    # Clean up temporary files
-    import shutil
-
-    if context.temp_dir.exists():
-        shutil.rmtree(context.temp_dir)
+    # Wait for outstanding scenario directory cleanups, then drop the pool
+    context.cleanup_executor.shutdown(wait=True)
+    while context.scenario_dir_pool:
+        shutil.rmtree(context.scenario_dir_pool.pop(), ignore_errors=True)
 
 
 def before_scenario(context, scenario):
@@ -45,6 +100,17 @@ def before_scenario(context, scenario):
     context.cli_exit_code = None
     context.cli_output = ""
     context.cli_error = ""
+    context.cli_combined = ""
+    context.cli_log_lines = []
+    context.cli_raw = None
+    context.cli_log_json = []
+
+    # Per-scenario directory for test outputs, taken from the pool when one is free
+    try:
+        context.scenario_dir_str = context.scenario_dir_pool.popleft()
+    except IndexError:
+        context.scenario_dir_str = _new_scenario_dir()
+    context.scenario_dir = Path(context.scenario_dir_str)
 
 
 def after_scenario(context, scenario):
@@ -54,3 +120,5 @@ def after_scenario(context, scenario):
         export_path = Path(context.export_file)
         if export_path.exists():
             export_path.unlink()
+
+    context.cleanup_executor.submit(_recycle_scenario_dir, context.scenario_dir_pool, context.scenario_dir_str)
@@ -0,0 +1,17 @@
+Feature: Export File Writing
+    As a user of azdo-process-export
+    I want large exports to be streamed to disk record by record
+    So that the streamed file is identical to a file written in one piece
+
+    Background:
+        Given I have a process export with teams, work item types and warnings
+
+    Scenario: Streamed export matches the document export
+        When I write the export to "process.json"
+        And I stream the export to "streamed.json"
+        Then "process.json" and "streamed.json" should contain the same JSON document
+        And "streamed.json" should contain the compact export bytes
+
+    Scenario: Exported keys use camelCase
+        When I stream the export to "streamed.json"
+        Then the streamed "teams" records should use camelCase keys
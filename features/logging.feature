@@ -29,6 +29,7 @@ Feature: Structured JSON Logging
         And the output should contain structured JSON logs
         And the JSON logs should contain trace context information
 
+    @subprocess
     Scenario: Log file output creates JSON file
         Given the environment variable "AZDO_ORGANIZATION" is set to "test-org"
         And I have a temporary directory for logs
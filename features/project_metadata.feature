@@ -29,3 +29,14 @@ Feature: Project Metadata Retrieval
         Then a list of projects should be returned
         And each project should have basic metadata fields
         And the list should support pagination if needed
+
+    Scenario: List all projects across every page
+        Given the organization has multiple projects
+        When I list every project in the organization
+        Then a list of projects should be returned
+        And each project should have basic metadata fields
+
+    Scenario: List project IDs and names
+        Given the organization has multiple projects
+        When I list project IDs and names in the organization
+        Then each listed project should have an ID and a name
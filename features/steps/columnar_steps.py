@@ -0,0 +1,37 @@
+"""
+Behave step definitions for the columnar export view.
+Checks that ProcessExport.to_columnar() transposes each record list correctly.
+"""
+
+import orjson
+from behave import then, when
+
+
+@when("I convert the export to columns")
+def step_convert_to_columns(context):
+    context.columns = context.process_export.to_columnar()
+
+
+@then('every "{table}" column should have {count:d} value')
+@then('every "{table}" column should have {count:d} values')
+def step_columns_have_values(context, table, count):
+    columns = context.columns[table]
+    assert columns, f"No {table} columns were produced"
+    for name, values in columns.items():
+        assert len(values) == count, f"Column {table}.{name} has {len(values)} values, expected {count}"
+
+
+@then('the "{table}" column "{column}" should contain {value:d}')
+@then('the "{table}" column "{column}" should contain "{value}"')
+def step_column_contains(context, table, column, value):
+    values = context.columns[table][column]
+    assert value in values, f"Column {table}.{column} does not contain {value!r}: {values}"
+
+
+@then('the "{table}" column names should match the exported record keys')
+def step_column_names_match_record_keys(context, table):
+    records = orjson.loads(context.process_export.to_json_bytes())[table]
+    assert records, f"The export has no {table} records"
+    expected = list(records[0])
+    actual = list(context.columns[table])
+    assert actual == expected, f"Column names {actual} differ from record keys {expected}"
@@ -0,0 +1,91 @@
+"""
+Behave step definitions for export file writing.
+Checks that the streaming writer produces the same document as the one-shot writer.
+"""
+
+from datetime import UTC, datetime
+
+import orjson
+from behave import given, then, when
+
+from azdo_process_export.domain.models import (
+    BugBehavior,
+    Metrics,
+    ProcessExport,
+    Project,
+    Team,
+    TeamMember,
+    TeamSettings,
+    WorkItemType,
+)
+from azdo_process_export.infrastructure.export_writer import ExportStreamWriter, write_export
+
+
+@given("I have a process export with teams, work item types and warnings")
+def step_have_process_export(context):
+    context.process_export = ProcessExport(
+        exported_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        project=Project(id="demo-project-id", name="Demo Project", revision=7),
+        work_item_types=[
+            WorkItemType(name="Bug", ref_name="Microsoft.VSTS.WorkItemTypes.Bug", usage_last_12m=42),
+        ],
+        teams=[
+            Team(
+                id="team-id",
+                name="Demo Project Team",
+                settings=TeamSettings(bugs_behavior=BugBehavior.AS_TASKS),
+                members=[TeamMember(id="member-id", display_name="Member", unique_name="member@example.com")],
+            )
+        ],
+        metrics=Metrics(work_items_created_per_month={"2024-01": 3}),
+        warnings=["Team settings could not be read"],
+    )
+    context.process_export.add_warning("Analytics metrics were skipped")
+    context.process_export.add_warning("Team settings could not be read")
+
+
+@when('I write the export to "{file_name}"')
+def step_write_export(context, file_name):
+    write_export(context.process_export, context.scenario_dir / file_name)
+
+
+@when('I stream the export to "{file_name}"')
+def step_stream_export(context, file_name):
+    export = context.process_export
+    with ExportStreamWriter(context.scenario_dir / file_name, flush_every=1) as writer:
+        writer.write_value("exportedAt", export.exported_at)
+        writer.write_value("project", export.project)
+        writer.write_records("workItemTypes", export.work_item_types)
+        writer.write_records("fields", export.fields)
+        writer.write_records("behaviors", export.behaviors)
+        writer.write_records("teams", export.teams)
+        writer.write_records("backlogLevels", export.backlog_levels)
+        writer.write_value("metrics", export.metrics)
+        writer.write_records("warnings", export.warnings)
+
+
+def _read_json(context, file_name):
+    return orjson.loads((context.scenario_dir / file_name).read_bytes())
+
+
+@then('"{first}" and "{second}" should contain the same JSON document')
+def step_same_json_document(context, first, second):
+    first_doc = _read_json(context, first)
+    second_doc = _read_json(context, second)
+    assert first_doc == second_doc, f"Documents differ:\n{first_doc}\n{second_doc}"
+
+
+@then('"{file_name}" should contain the compact export bytes')
+def step_compact_export_bytes(context, file_name):
+    expected = context.process_export.to_json_bytes() + b"\n"
+    actual = (context.scenario_dir / file_name).read_bytes()
+    assert actual == expected, f"Streamed bytes differ:\n{actual!r}\n{expected!r}"
+
+
+@then('the streamed "{member}" records should use camelCase keys')
+def step_records_use_camel_case(context, member):
+    records = _read_json(context, "streamed.json")[member]
+    assert records, f"No {member} records were streamed"
+    for record in records:
+        snake_keys = [key for key in record if "_" in key]
+        assert not snake_keys, f"Streamed {member} record has snake_case keys: {snake_keys}"
@@ -4,10 +4,39 @@ Tests the async HTTP client functionality for Azure DevOps API calls.
 """
 
 import asyncio
+import atexit
 from pathlib import Path
 
 from behave import given, then, when
 
+# One event loop for every async step; loop setup is paid once per run
+_LOOP = None
+
+# Clients by (organization, pat), so their connection pools survive across scenarios
+_CLIENTS = {}
+
+
+def _get_loop():
+    """Return the shared event loop, creating it on first use."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+
+def _close_loop():
+    """Close cached clients and the shared event loop at exit."""
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    for client in _CLIENTS.values():
+        _LOOP.run_until_complete(client.aclose())
+    _CLIENTS.clear()
+    _LOOP.close()
+
+
+atexit.register(_close_loop)
+
 
 @given("I have Azure DevOps connection details")
 def step_have_azdo_connection_details(context):
@@ -25,10 +54,13 @@ def step_have_minimal_http_client(context):
         # Try to import the HTTP client - this should fail initially (RED phase)
         from azdo_process_export.infrastructure.http_client import AzureDevOpsClient
         
-        context.http_client = AzureDevOpsClient(
-            organization=context.azdo_organization,
-            pat=context.azdo_pat
-        )
+        key = (context.azdo_organization, context.azdo_pat)
+        if key not in _CLIENTS:
+            _CLIENTS[key] = AzureDevOpsClient(
+                organization=context.azdo_organization,
+                pat=context.azdo_pat
+            )
+        context.http_client = _CLIENTS[key]
         context.client_imported = True
     except ImportError:
         context.client_imported = False
@@ -43,16 +75,11 @@ def step_make_async_request_list_projects(context):
         return
     
     try:
-        # Run the async call
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            context.api_response = loop.run_until_complete(
-                context.http_client.list_projects()
-            )
-            context.api_error = None
-        finally:
-            loop.close()
+        # Run the async call on the shared loop
+        context.api_response = _get_loop().run_until_complete(
+            context.http_client.list_projects()
+        )
+        context.api_error = None
     except Exception as e:
         context.api_error = str(e)
         context.api_response = None
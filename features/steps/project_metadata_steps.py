@@ -31,6 +31,7 @@ def step_have_valid_credentials(context):
     context.credentials = context.test_pat or "demo-personal-access-token"
     
     # Initialize the real service
+    # A fresh service per scenario, so no scenario sees projects cached by an earlier one
     context.metadata_service = ProjectMetadataService(
         organization_url=context.organization_url,
         personal_access_token=context.credentials
@@ -100,6 +101,28 @@ def step_list_all_projects(context):
         context.error = e
 
 
+@when("I list every project in the organization")
+def step_list_every_project(context):
+    """List every project across all pages using real service."""
+    try:
+        context.result = context.metadata_service.list_all_projects()
+        context.error = None
+    except Exception as e:
+        context.result = None
+        context.error = e
+
+
+@when("I list project IDs and names in the organization")
+def step_list_project_ids_and_names(context):
+    """List project IDs and names as parallel lists using real service."""
+    try:
+        context.result = context.metadata_service.list_project_ids_and_names()
+        context.error = None
+    except Exception as e:
+        context.result = None
+        context.error = e
+
+
 @then("the project metadata should be returned")
 def step_project_metadata_returned(context):
     """Verify that project metadata was returned."""
@@ -176,3 +199,14 @@ def step_list_supports_pagination(context):
     # In a real implementation, this would test pagination parameters
     assert hasattr(context.metadata_service, 'list_projects'), "Service should have list_projects method"
     # Note: Actual pagination testing would require more complex setup with real API calls
+
+
+@then("each listed project should have an ID and a name")
+def step_each_listed_project_has_id_and_name(context):
+    """Verify that the ID and name columns line up and are all populated."""
+    assert context.result is not None, f"A result should be returned, got error: {context.error}"
+    ids, names = context.result
+    assert len(ids) > 0, "List should contain projects"
+    assert len(ids) == len(names), "Each project ID should have a matching name"
+    assert all(ids), "Each project should have an ID"
+    assert all(names), "Each project should have a name"
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Run the Behave suite sharded across worker processes.
+
+Scenarios are assigned to workers by a stable hash of their location, so a
+given scenario always runs on the same shard. Each worker is an ordinary
+``behave`` run over its scenario locations; any extra arguments are passed
+through to every worker.
+
+Example:
+    uv run python scripts/behave_parallel.py --processes 4 -- --tags=~@wip
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+
+from behave.parser import parse_file
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def collect_scenarios(features_dir: Path) -> list[str]:
+    """
+    Collect the location of every scenario in a features directory.
+
+    Args:
+        features_dir: Directory containing .feature files
+
+    Returns:
+        Scenario locations in ``path:line`` form, relative to the project root
+    """
+    locations = []
+    for feature_file in sorted(features_dir.glob("*.feature")):
+        feature = parse_file(str(feature_file))
+        if feature is None:
+            continue
+        relative = feature_file.relative_to(PROJECT_ROOT)
+        locations.extend(f"{relative}:{scenario.line}" for scenario in feature.scenarios)
+    return locations
+
+
+def shard(locations: list[str], processes: int) -> list[list[str]]:
+    """
+    Split scenario locations into shards by a stable hash.
+
+    Args:
+        locations: Scenario locations
+        processes: Number of shards
+
+    Returns:
+        Non-empty shards of scenario locations
+    """
+    shards: list[list[str]] = [[] for _ in range(processes)]
+    for location in locations:
+        shards[zlib.crc32(location.encode()) % processes].append(location)
+    return [s for s in shards if s]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", "-n", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--features", type=Path, default=PROJECT_ROOT / "features", help="Features directory")
+    parser.add_argument("behave_args", nargs=argparse.REMAINDER, help="Arguments passed through to behave")
+    args = parser.parse_args()
+
+    behave_args = args.behave_args[1:] if args.behave_args[:1] == ["--"] else args.behave_args
+    shards = shard(collect_scenarios(args.features), max(args.processes, 1))
+
+    workers = []
+    for worker_id, locations in enumerate(shards):
+        env = {**os.environ, "BEHAVE_WORKER_ID": str(worker_id)}
+        cmd = [sys.executable, "-m", "behave", "-f", "progress", *behave_args, *locations]
+        workers.append(subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env))
+
+    exit_codes = [worker.wait() for worker in workers]
+    # A worker killed by a signal returns a negative code; report it as a plain failure
+    return next((code if code > 0 else 1 for code in exit_codes if code), 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())